@@ -28,7 +28,7 @@ from refine import (
     clean_text, word_count, is_valid_text,
     list_input_files, read_text_file, write_text_file, generate_output_filename, ensure_directories,
     # Ollama integration
-    get_available_models, get_ollama_status, DETERMINISTIC_ONLY_MODEL, refine_text, validate_model,
+    get_available_models, get_ollama_status, DETERMINISTIC_ONLY_MODEL, refine_text, validate_model, warm_up_model,
     # Minimal UI
     show_header, show_error_message, show_processing_complete, show_success_message, show_exit_message, show_interrupted_message, get_user_input
 )
@@ -133,48 +133,72 @@ def process_file(input_path: str, output_path: str, model_name: str, **kwargs) -
     used_cache = False
 
     try:
-        # Validate input file
-        if not os.path.exists(input_path):
+        # Validate input file; one stat serves the existence and streaming checks.
+        try:
+            input_size = os.path.getsize(input_path)
+        except OSError:
             show_error_message(f"Input file not found: {input_path}")
             monitor.record_error()
             return False
 
-        # Read input file
         print(f"📖 Processing: {os.path.basename(input_path)}")
 
         # Check if file should use streaming (unless disabled)
         no_streaming = kwargs.get('no_streaming', False)
-        if not no_streaming and streaming_processor.should_use_streaming(input_path):
-            original_text = streaming_processor.process_large_file(input_path, model_name)
+        if not no_streaming and streaming_processor.should_use_streaming(input_path, input_size):
+            # Validate before any chunk reaches the model; the scan stops as
+            # soon as there is enough text, so the file is never held whole.
+            content_characters = streaming_processor.count_content_characters(input_path, limit=11)
+            if not content_characters:
+                print("❌ Empty file")
+                return False
+            if content_characters <= 10:
+                print("❌ Text too short or invalid")
+                return False
+
+            print("📚 Processing as readable PT-BR transcript")
+            # Streamed chunks are cleaned and refined as they are read, so the
+            # result is final and must not go through the single pass again.
+            # Word and character counts come from the chunks as they are read.
+            input_stats: Dict[str, int] = {}
+            refined_text = streaming_processor.process_large_file(
+                input_path, model_name, input_size, stats=input_stats
+            )
             used_streaming = True
+
+            original_words = input_stats["words"]
+            file_size = input_stats["characters"]
         else:
             original_text = read_text_file(input_path, DEFAULT_ENCODING)
 
-        if not original_text or not original_text.strip():
-            print("❌ Empty file")
-            return False
+            if not original_text or original_text.isspace():
+                print("❌ Empty file")
+                return False
 
-        # Validate text content
-        if not is_valid_text(original_text):
-            print("❌ Text too short or invalid")
-            return False
+            # Validate text content
+            if not is_valid_text(original_text):
+                print("❌ Text too short or invalid")
+                return False
 
-        print("📚 Processing as readable PT-BR transcript")
+            print("📚 Processing as readable PT-BR transcript")
 
-        # Clean and prepare text
-        cleaned_text = clean_text(original_text)
+            # Clean and prepare text
+            cleaned_text = clean_text(original_text)
 
-        # Single-pass refinement
-        print("   📝 Using single-pass readable transcript refinement")
-        from refine.ollama_integration import single_pass_refine as single_refine
+            # Single-pass refinement
+            print("   📝 Using single-pass readable transcript refinement")
+            from refine.ollama_integration import single_pass_refine as single_refine
 
-        # Check if we have cached LLM response
-        from refine.utils import get_global_cache
-        cache = get_global_cache()
-        if cache.get_llm_response(cleaned_text, model_name):
-            used_cache = True
+            # Check if we have cached LLM response
+            from refine.utils import get_global_cache
+            cache = get_global_cache()
+            if cache.get_llm_response(cleaned_text, model_name):
+                used_cache = True
 
-        refined_text = single_refine(cleaned_text, model_name)
+            refined_text = single_refine(cleaned_text, model_name)
+
+            original_words = word_count(original_text)
+            file_size = len(original_text)
 
         # Ensure output directory exists
         output_dir = os.path.dirname(output_path)
@@ -189,9 +213,7 @@ def process_file(input_path: str, output_path: str, model_name: str, **kwargs) -
             return False
 
         # Statistics and performance monitoring
-        original_words = word_count(original_text)
         refined_words = word_count(refined_text)
-        file_size = len(original_text)
         processing_time = time.time() - file_start_time
 
         # Record performance metrics
@@ -238,6 +260,9 @@ def process_files_concurrent(input_paths: List[str], output_paths: List[str], mo
     results = {}
     start_time = time.time()
 
+    # Load the model once so concurrent workers hit a warm prompt prefix
+    warm_up_model(model_name)
+
     # Create partial function with fixed parameters
     process_func = partial(process_file, model_name=model_name, no_streaming=no_streaming)
 
@@ -477,6 +502,7 @@ def main():
             print(f"   LLM responses cached: {stats['llm_cache_size']}")
             print(f"   Transcript corrections cached: {stats['transcript_cache_size']}")
             print(f"   Total cache entries: {stats['total_cache_entries']}")
+            print(f"   Cached text size: {stats['bytes_used'] / 1024:.1f} KB")
             return
 
         if args.process_all:
@@ -12,14 +12,12 @@ from .utils import (
 # Ollama integration
 from .ollama_integration import (
     check_ollama, get_available_models, get_ollama_status,
-    DETERMINISTIC_ONLY_MODEL, single_pass_refine as refine_text, validate_model
+    DETERMINISTIC_ONLY_MODEL, single_pass_refine as refine_text, validate_model, warm_up_model
 )
 
 # Core deterministic transcript cleanup
-from .transcript_refinement import TranscriptRefinementSystem
-
-# Backwards-compatible alias for older imports.
-BPPhilosophySystem = TranscriptRefinementSystem
+# (BPPhilosophySystem is the backwards-compatible alias for older imports.)
+from .transcript_refinement import TranscriptRefinementSystem, BPPhilosophySystem
 
 # Minimal UI
 from .ui import show_header, show_error_message, show_processing_complete, show_success_message, show_exit_message, show_interrupted_message, get_user_input
@@ -31,7 +29,7 @@ __all__ = [
     'generate_output_filename', 'ensure_directories',
     # Ollama integration
     'check_ollama', 'get_available_models', 'get_ollama_status',
-    'DETERMINISTIC_ONLY_MODEL', 'refine_text', 'validate_model',
+    'DETERMINISTIC_ONLY_MODEL', 'refine_text', 'validate_model', 'warm_up_model',
     # Core transcript functionality
     'TranscriptRefinementSystem',
     'BPPhilosophySystem',
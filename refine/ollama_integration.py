@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 try:
     import ollama
@@ -11,18 +15,51 @@ except ImportError:  # pragma: no cover - exercised through function behavior
     ollama = None
 
 from .transcript_refinement import TranscriptRefinementSystem
-from .utils import get_global_cache
-
-SYSTEM_PROMPT = (
-    "You are a transcript editor for Brazilian Portuguese voice memos. "
-    "Improve readability with punctuation, capitalization, paragraph breaks, "
-    "and obvious ASR fixes, but preserve meaning, chronology, tone, and language. "
-    "Do not summarize, translate, invent content, or rewrite the transcript into essay prose. "
-    "Prefer clear sentences and short readable paragraphs instead of one wall of text."
+from .utils import (
+    get_disk_cache,
+    get_global_cache,
+    get_performance_monitor,
+    reconstruct_with_paragraphs,
+    split_into_chunks,
 )
 
+SYSTEM_PROMPT = "You are a transcript editor for Brazilian Portuguese voice memos."
+
 DETERMINISTIC_ONLY_MODEL = "deterministic-only"
 
+# Keep the model (and its cached prompt prefix) resident between requests so
+# consecutive chunks only prefill the part of the prompt that actually changed.
+OLLAMA_KEEP_ALIVE = os.getenv("TXTREFINE_KEEP_ALIVE", "30m")
+
+
+# Chunks at or under this many words are only sent to the model when they
+# still show a transcription artifact after deterministic cleanup.
+REVIEW_MIN_WORDS = 30
+
+_REPEATED_WORD_PATTERN = re.compile(r"\b(\w+)\s+\1\b", re.IGNORECASE)
+
+
+def _needs_model_review(text: str) -> bool:
+    """Cheap pre-filter: skip the model for short chunks that are already clean."""
+    # maxsplit stops tokenizing once the threshold is exceeded.
+    if len(text.split(None, REVIEW_MIN_WORDS)) > REVIEW_MIN_WORDS:
+        return True
+    return _REPEATED_WORD_PATTERN.search(text) is not None
+
+
+def _get_num_parallel() -> int:
+    """Number of concurrent requests to send, matching Ollama's parallel slots."""
+    try:
+        return max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+    except ValueError:
+        return 4
+
+
+@lru_cache(maxsize=1)
+def _get_transcript_system() -> TranscriptRefinementSystem:
+    """Build the deterministic cleanup system once and share it across calls."""
+    return TranscriptRefinementSystem()
+
 
 def get_ollama_status() -> Dict[str, object]:
     """Report whether the Python package and local Ollama server are available."""
@@ -54,31 +91,152 @@ def get_available_models() -> list:
     return list(get_ollama_status()["available_models"])
 
 
-def build_refinement_prompt(text: str) -> str:
-    """Build the user prompt for transcript refinement."""
-    return f"""
-TASK: Rewrite this raw transcript as a readable transcript.
-
-GOALS:
-1) Fix obvious spelling and ASR mistakes
-2) Improve punctuation, capitalization, sentence boundaries, and paragraph breaks
-3) Remove accidental duplicate fragments and repeated connector words
-4) Preserve the original meaning, chronology, and spoken tone
-
-STRICT RULES:
-- Do not summarize
-- Do not translate
-- Do not add speaker labels unless already present
-- Do not invent missing information
-- Do not turn it into polished article prose
-- Do not return a single long wall of text when natural sentence and paragraph breaks are inferable
+# Static instruction block sent ahead of every transcript. It must stay
+# byte-identical between calls so Ollama can reuse the cached prefix.
+REFINEMENT_INSTRUCTIONS = """TASK: Rewrite this raw transcript as a readable transcript.
+
+- Fix obvious spelling and ASR mistakes
+- Improve punctuation, capitalization, sentence boundaries, and paragraph breaks; never return one wall of text
+- Remove accidental duplicate fragments and repeated connector words
+- Preserve meaning, chronology, spoken tone, and language
+- Do not summarize, translate, invent content, add speaker labels, or turn it into article prose
 
 TEXT:
-{text}
+"""
+
+REFINEMENT_OUTPUT_INSTRUCTIONS = """
 
 OUTPUT:
-Return only the cleaned transcript.
-""".strip()
+Return only the cleaned transcript."""
+
+
+def build_refinement_prompt(text: str) -> str:
+    """Build the user prompt for transcript refinement."""
+    return REFINEMENT_INSTRUCTIONS + text.strip() + REFINEMENT_OUTPUT_INSTRUCTIONS
+
+
+def _refinement_options(input_words: int) -> Dict[str, object]:
+    """Sampling options with an output cap so a runaway generation stops early.
+
+    PT-BR averages under two tokens per word, so three tokens per input word
+    leaves room for punctuation and paragraph breaks without truncating.
+    """
+    return {"temperature": 0.1, "num_predict": input_words * 3 + 64}
+
+
+def _refinement_messages(text: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": build_refinement_prompt(text)},
+    ]
+
+
+def _collect_stream(stream: Iterable[Dict[str, object]], max_words: int) -> Optional[str]:
+    """Accumulate streamed content, aborting once it grows past ``max_words`` words.
+
+    Words are counted incrementally (a token that continues the previous word
+    is not counted twice), so the check stays linear in the output length.
+    Returns ``None`` when the generation was cut off.
+    """
+    parts: List[str] = []
+    words = 0
+    in_word = False
+    try:
+        for chunk in stream:
+            piece = chunk["message"]["content"]
+            if not piece:
+                continue
+            parts.append(piece)
+            words += len(piece.split())
+            if in_word and not piece[0].isspace():
+                words -= 1
+            in_word = not piece[-1].isspace()
+            if words > max_words:
+                return None
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            # Closing the generator drops the HTTP stream, cancelling generation server-side.
+            close()
+    return "".join(parts)
+
+
+def _cached_chat(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_words: Optional[int] = None,
+    **kwargs: object,
+) -> Optional[str]:
+    """Call ``ollama.chat`` and return the content, reusing on-disk responses when enabled.
+
+    With ``max_words`` the response is streamed and abandoned (returning ``None``)
+    as soon as it exceeds that many words.
+    """
+    disk_cache = get_disk_cache("llm")
+    cache_key = None
+    if disk_cache.is_enabled():
+        cache_key = disk_cache.make_key(
+            model,
+            json.dumps(messages, ensure_ascii=False, sort_keys=True),
+            json.dumps(kwargs, ensure_ascii=False, sort_keys=True),
+        )
+        cached_content = disk_cache.get(cache_key)
+        if isinstance(cached_content, str):
+            return cached_content
+
+    if max_words is None:
+        response = ollama.chat(
+            model=model,
+            messages=messages,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            **kwargs,
+        )
+        content = response["message"]["content"]
+    else:
+        stream = ollama.chat(
+            model=model,
+            messages=messages,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            stream=True,
+            **kwargs,
+        )
+        content = _collect_stream(stream, max_words)
+        if content is None:
+            return None
+
+    if cache_key is not None:
+        disk_cache.set(cache_key, content)
+    return content
+
+
+def warm_up_model(model: str) -> bool:
+    """Load the model and prefill the shared instruction prefix ahead of real work."""
+    if model == DETERMINISTIC_ONLY_MODEL or ollama is None:
+        return False
+
+    try:
+        ollama.chat(
+            model=model,
+            messages=_refinement_messages(""),
+            options={"temperature": 0.1, "num_predict": 1},
+            keep_alive=OLLAMA_KEEP_ALIVE,
+        )
+        return True
+    except Exception:
+        return False
+
+
+def _accept_refinement(refined_text: Optional[str], corrected_text: str, input_words: int) -> str:
+    """Return the model output, or the deterministic text if it ran away or dropped content."""
+    if refined_text is None:
+        print("⚠️  Model output ran away, using deterministic transcript cleanup")
+        return corrected_text
+    refined_text = refined_text.strip()
+    # An unchanged echo cannot have lost content.
+    if refined_text != corrected_text and len(refined_text.split()) < input_words * 0.9:
+        print("⚠️  Content loss detected, using deterministic transcript cleanup")
+        return corrected_text
+    return refined_text
 
 
 def single_pass_refine(text: str, model: str = "llama3.2:latest") -> str:
@@ -89,7 +247,7 @@ def single_pass_refine(text: str, model: str = "llama3.2:latest") -> str:
         print("✅ Using cached LLM response")
         return cached_response
 
-    transcript_system = TranscriptRefinementSystem()
+    transcript_system = _get_transcript_system()
     corrected_text, corrections = transcript_system.find_and_correct_terms(text)
 
     if corrections:
@@ -98,23 +256,17 @@ def single_pass_refine(text: str, model: str = "llama3.2:latest") -> str:
     if model == DETERMINISTIC_ONLY_MODEL or ollama is None:
         return corrected_text
 
+    # Tokenize once; the output cap, runaway bound and loss check all reuse it.
+    input_words = len(corrected_text.split())
     try:
-        from .utils import get_performance_monitor
-
         get_performance_monitor().record_llm_call()
-        response = ollama.chat(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": build_refinement_prompt(corrected_text)},
-            ],
-            options={"temperature": 0.1},
+        refined_text = _cached_chat(
+            model,
+            _refinement_messages(corrected_text),
+            max_words=input_words * 2,
+            options=_refinement_options(input_words),
         )
-
-        refined_text = response["message"]["content"].strip()
-        if len(refined_text.split()) < len(corrected_text.split()) * 0.9:
-            print("⚠️  Content loss detected, using deterministic transcript cleanup")
-            refined_text = corrected_text
+        refined_text = _accept_refinement(refined_text, corrected_text, input_words)
 
         cache.set_llm_response(text, model, refined_text)
         return refined_text
@@ -131,57 +283,108 @@ def validate_model(model_name: str) -> bool:
     return model_name in get_available_models()
 
 
+# Structured-output schema for paragraph segmentation. Ollama constrains
+# decoding to it, so the response is always parseable JSON of this shape.
+PARAGRAPHS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "paragraphs": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["paragraphs"],
+}
+
+
+SEGMENTATION_SYSTEM_PROMPT = "You are a transcript segmentation expert."
+
+# Fixed prefix for segmentation requests; the transcript is appended after it.
+SEGMENTATION_INSTRUCTIONS = """You segment raw voice-memo transcripts into readable paragraphs.
+
+Transcript:
+"""
+
+
+def _matches_paragraphs_schema(parsed: object) -> bool:
+    """Check a decoded response against ``PARAGRAPHS_SCHEMA`` in one pass."""
+    if not isinstance(parsed, dict):
+        return False
+    paragraphs = parsed.get("paragraphs")
+    return type(paragraphs) is list and all(type(item) is str for item in paragraphs)
+
+
 def smart_chunk_text(text: str, model: str = "llama3.2:latest", max_words: int = 800) -> List[str]:
     """Optionally ask the model to suggest paragraph boundaries for a transcript."""
     if ollama is None:
         return [text]
 
     try:
-        chunking_prompt = f"""You segment raw voice-memo transcripts into readable paragraphs.
-
-Return only valid JSON with the shape {{"paragraphs": ["..."]}}.
-
-Transcript:
-{text}
-"""
-        response = ollama.chat(
-            model=model,
-            messages=[
-                {"role": "system", "content": "You are a transcript segmentation expert. Output only valid JSON."},
-                {"role": "user", "content": chunking_prompt},
+        # _cached_chat keys the on-disk cache by the full prompt and schema, so
+        # segmentation is reused across runs without a cache of its own.
+        content = _cached_chat(
+            model,
+            [
+                {"role": "system", "content": SEGMENTATION_SYSTEM_PROMPT},
+                {"role": "user", "content": SEGMENTATION_INSTRUCTIONS + text + "\n"},
             ],
             options={"temperature": 0.1},
+            format=PARAGRAPHS_SCHEMA,
         )
 
-        parsed = json.loads(response["message"]["content"].strip())
-        paragraphs = parsed.get("paragraphs")
-        if isinstance(paragraphs, list):
-            cleaned = [paragraph.strip() for paragraph in paragraphs if paragraph.strip()]
-            return cleaned or [text]
-        return [text]
+        parsed = json.loads(content.strip())
+        if not _matches_paragraphs_schema(parsed):
+            return [text]
+        cleaned = [paragraph for paragraph in map(str.strip, parsed["paragraphs"]) if paragraph]
+        if not cleaned:
+            return [text]
+        return cleaned
     except Exception:
         return [text]
 
 
 def refine_text_with_paragraphs(text: str, model: str = "llama3.2:latest", chunk_size: int = 800) -> str:
-    """Compatibility wrapper for the single-pass refinement path."""
-    return single_pass_refine(text, model)
+    """Refine a transcript in paragraph-aligned chunks, overlapping the model calls.
+
+    Consecutive paragraphs are packed into chunks of up to ``chunk_size`` words
+    so short paragraphs share one request. Chunks are dispatched concurrently
+    (bounded by ``OLLAMA_NUM_PARALLEL``) and reassembled in their original order.
+    """
+    chunks = split_into_chunks(text, max_words=chunk_size)
+    if len(chunks) <= 1:
+        return single_pass_refine(text, model)
+
+    # Repeated boilerplate chunks are refined once and the result reused.
+    unique_chunks = list(dict.fromkeys(chunks))
+
+    transcript_system = _get_transcript_system()
+    max_workers = min(len(unique_chunks), _get_num_parallel())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        refined = dict(
+            zip(
+                unique_chunks,
+                executor.map(
+                    lambda chunk: _process_single_chunk(chunk, transcript_system, model),
+                    unique_chunks,
+                ),
+            )
+        )
+    return reconstruct_with_paragraphs([refined[chunk] for chunk in chunks])
 
 
 def _process_single_chunk(chunk: str, transcript_system: TranscriptRefinementSystem, model: str) -> str:
     """Process a single chunk with deterministic cleanup and readable transcript polishing."""
     corrected_text, _ = transcript_system.find_and_correct_terms(chunk)
-    if ollama is None:
+    if model == DETERMINISTIC_ONLY_MODEL or ollama is None:
+        return corrected_text
+    if not _needs_model_review(corrected_text):
         return corrected_text
+    input_words = len(corrected_text.split())
     try:
-        response = ollama.chat(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": build_refinement_prompt(corrected_text)},
-            ],
-            options={"temperature": 0.1},
+        get_performance_monitor().record_llm_call()
+        refined_text = _cached_chat(
+            model,
+            _refinement_messages(corrected_text),
+            max_words=input_words * 2,
+            options=_refinement_options(input_words),
         )
-        return response["message"]["content"].strip()
+        return _accept_refinement(refined_text, corrected_text, input_words)
     except Exception:
         return corrected_text
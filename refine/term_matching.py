@@ -5,26 +5,77 @@ This module provides:
 - ``REFINED_DICT`` with small transcript-focused canonical term groups
 - ``CORRECTIONS_MAP`` for common PT-BR ASR/product-name corrections
 - ``find_best_match`` to support exact/fuzzy matching within a group
+- ``apply_corrections`` to fix every ``CORRECTIONS_MAP`` variant in one pass
 """
 
 from difflib import get_close_matches
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
 import unicodedata
 
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:  # pragma: no cover - difflib fallback below
+    fuzz = None
+    fuzz_process = None
+
+WORD_CHARS = r"A-Za-zÀ-ÿ0-9"
+
 
 def normalize_text(text: str) -> str:
     """Lowercase, trim, and strip accents/diacritics for robust matching."""
     if not text:
         return ""
-    text = text.lower().strip()
+    # Short terms recur constantly and are memoized; long passages rarely
+    # repeat and would only churn the cache.
+    if len(text) > _NORMALIZE_CACHE_MAX_LEN:
+        return _normalize_uncached(text)
+    return _normalize_cached(text)
+
+
+_NORMALIZE_CACHE_MAX_LEN = 64
+
+
+def _strip_marks(text: str) -> str:
     return "".join(
         char for char in unicodedata.normalize("NFD", text)
         if unicodedata.category(char) != "Mn"
     )
 
 
+def _build_accent_table() -> Dict[int, str]:
+    # Derived from the NFD path itself, so both always agree on Latin-1.
+    table: Dict[int, str] = {}
+    for codepoint in range(0xC0, 0x100):
+        stripped = _strip_marks(chr(codepoint))
+        if stripped != chr(codepoint):
+            table[codepoint] = stripped
+    return table
+
+
+# Latin-1 accented letters (all of PT-BR's) mapped straight to their base letter.
+_ACCENT_TABLE = str.maketrans(_build_accent_table())
+
+
+def _normalize_uncached(text: str) -> str:
+    text = text.lower().strip()
+    if text.isascii():
+        # ASCII has no combining marks, so NFD filtering would be a no-op.
+        return text
+    # One C-level translate covers typical PT-BR text; anything still outside
+    # ASCII afterwards takes the full NFD path.
+    translated = text.translate(_ACCENT_TABLE)
+    if translated.isascii():
+        return translated
+    return _strip_marks(text)
+
+
+_normalize_cached = lru_cache(maxsize=8192)(_normalize_uncached)
+
+
 REFINED_DICT = {
-    "platform_terms": [
+    "platform_terms": (
         "microsoft teams",
         "google meet",
         "google docs",
@@ -32,8 +83,8 @@ REFINED_DICT = {
         "whatsapp",
         "chatgpt",
         "ollama",
-    ],
-    "transcript_terms": [
+    ),
+    "transcript_terms": (
         "transcricao",
         "voice memo",
         "nota de voz",
@@ -41,7 +92,7 @@ REFINED_DICT = {
         "reuniao",
         "entrevista",
         "gravacao",
-    ],
+    ),
 }
 
 
@@ -66,12 +117,116 @@ CORRECTIONS_MAP = {
     "transcrisao": "transcrição",
 }
 
+# Both sides normalized up front so lookups never re-normalize a replacement.
 NORMALIZED_CORRECTIONS_MAP = {
-    normalize_text(original): replacement
+    normalize_text(original): normalize_text(replacement)
     for original, replacement in CORRECTIONS_MAP.items()
 }
 
 
+
+def _trie_alternation(phrases: Iterable[str]) -> str:
+    """Build a prefix-factored regex alternation that prefers the longest phrase.
+
+    Shared prefixes are matched once, and a phrase that is a prefix of another
+    becomes an optional (greedy) tail, so no length-sorted alternation is needed.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: Dict[str, dict]) -> str:
+    branches = [
+        re.escape(char) + _trie_node_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+def _build_replacement_variants() -> Dict[str, Tuple[str, str, str]]:
+    # (as written, UPPER, Title) per variant, resolved once instead of per match.
+    # Multi-word replacements keep their canonical casing in every form.
+    # Keyed by casefold(): IGNORECASE also matches characters such as "ſ"
+    # (for "s") or the Kelvin sign (for "k") that lower() leaves unchanged.
+    variants: Dict[str, Tuple[str, str, str]] = {}
+    for original, replacement in CORRECTIONS_MAP.items():
+        key = original.casefold()
+        if " " in replacement:
+            variants[key] = (replacement, replacement, replacement)
+        else:
+            variants[key] = (replacement, replacement.upper(), replacement.capitalize())
+    return variants
+
+
+# Every CORRECTIONS_MAP variant as one whole-word, case-insensitive pattern.
+CORRECTIONS_PATTERN = re.compile(
+    rf"(?<![{WORD_CHARS}])(?:{_trie_alternation(CORRECTIONS_MAP)})(?![{WORD_CHARS}])",
+    re.IGNORECASE,
+)
+
+_REPLACEMENT_VARIANTS = _build_replacement_variants()
+
+
+def has_correction_candidates(text: str) -> bool:
+    """Cheap pre-check: can ``CORRECTIONS_PATTERN`` match anywhere in ``text``?
+
+    Plain substring tests rule most text out much faster than the
+    lookbehind-anchored regex scan.
+    """
+    folded = text.casefold()
+    return any(variant in folded for variant in _REPLACEMENT_VARIANTS)
+
+
+def _variants_by_pattern(matched: str) -> Tuple[str, str, str]:
+    """Slow path for matches whose casefold() differs from the IGNORECASE match.
+
+    Characters such as "İ" match "i" under IGNORECASE but casefold to "i̇", so
+    the variant is found the way the pattern found it.
+    """
+    for original, variants in _REPLACEMENT_VARIANTS.items():
+        if re.fullmatch(re.escape(original), matched, re.IGNORECASE):
+            return variants
+    return (matched, matched, matched)
+
+
+def corrected_form(matched: str) -> str:
+    """Replacement for a ``CORRECTIONS_PATTERN`` match, following its casing."""
+    variants = _REPLACEMENT_VARIANTS.get(matched.casefold())
+    if variants is None:
+        variants = _variants_by_pattern(matched)
+    as_written, upper, title = variants
+    if matched.isupper():
+        return upper
+    if matched.istitle():
+        return title
+    return as_written
+
+
+def apply_corrections(text: str) -> str:
+    """Apply every ``CORRECTIONS_MAP`` fix to ``text`` in a single regex pass."""
+    if not has_correction_candidates(text):
+        return text
+    return CORRECTIONS_PATTERN.sub(lambda match: corrected_form(match.group(0)), text)
+
+
+# Exact-match fast path: most lookups hit a canonical term and skip difflib.
+_REFINED_TERM_SETS = {
+    category: frozenset(terms) for category, terms in REFINED_DICT.items()
+}
+
+
 def find_best_match(term: str, category: str, cutoff: float = 0.8) -> Optional[str]:
     """Return best normalized match from a category, or ``None``."""
     normalized_term = normalize_text(term)
@@ -79,15 +234,36 @@ def find_best_match(term: str, category: str, cutoff: float = 0.8) -> Optional[s
     if not normalized_term or category not in REFINED_DICT:
         return None
 
-    if normalized_term in NORMALIZED_CORRECTIONS_MAP:
-        normalized_term = normalize_text(NORMALIZED_CORRECTIONS_MAP[normalized_term])
+    normalized_term = NORMALIZED_CORRECTIONS_MAP.get(normalized_term, normalized_term)
 
-    if normalized_term in REFINED_DICT[category]:
+    if normalized_term in _REFINED_TERM_SETS[category]:
         return normalized_term
 
+    return _closest_match(normalized_term, category, cutoff)
+
+
+@lru_cache(maxsize=8192)
+def _closest_match(normalized_term: str, category: str, cutoff: float) -> Optional[str]:
+    """Fuzzy lookup, memoized since the same misheard terms recur across chunks."""
+    candidates = REFINED_DICT[category]
+    if fuzz_process is not None:
+        # The Indel ratio is never below difflib's ratio, so its native cutoff
+        # safely shortlists candidates; difflib then picks among them, which
+        # keeps results identical whether or not rapidfuzz is installed.
+        shortlist = fuzz_process.extract(
+            normalized_term,
+            candidates,
+            scorer=fuzz.ratio,
+            score_cutoff=cutoff * 100 - 1e-6,
+            limit=None,
+        )
+        candidates = [choice for choice, _score, _index in shortlist]
+        if not candidates:
+            return None
+
     matches: List[str] = get_close_matches(
         normalized_term,
-        REFINED_DICT[category],
+        candidates,
         n=1,
         cutoff=cutoff,
     )
@@ -3,188 +3,196 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .term_matching import (
+    CORRECTIONS_MAP,
+    CORRECTIONS_PATTERN,
+    WORD_CHARS,
+    corrected_form,
+    find_best_match as _tm_find_best_match,
+    has_correction_candidates,
+)
+from .utils import get_global_cache, get_performance_monitor
+
+_EDGE_PUNCTUATION_PATTERN = re.compile(rf"^[^{WORD_CHARS}]+|[^{WORD_CHARS}]+$")
+_SENTENCE_PATTERN = re.compile(r"[^.!?]+[.!?]?")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]")
+_SENTENCE_START_PATTERN = re.compile(r"(^|(?<=[.!?]\s))([a-zà-ÿ])", re.IGNORECASE)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n+")
+
+
+class Correction(NamedTuple):
+    """A single deterministic fix applied to a transcript."""
+
+    original: str
+    corrected: str
+    position: int
+
+
+# Tokens after which a run-on paragraph may be broken into a new sentence.
+SENTENCE_BREAK_MARKERS = (
+    ("mas",),
+    ("porém",),
+    ("então",),
+    ("depois",),
+    ("agora",),
+    ("daí",),
+    ("no", "entanto"),
+    ("só", "que"),
+    ("por", "isso"),
+    ("nesse", "ponto"),
+    ("além", "disso"),
+    ("por", "outro", "lado"),
+)
+
+PARAGRAPH_START_MARKERS = frozenset({
+    "agora",
+    "além disso",
+    "daí",
+    "depois",
+    "nesse ponto",
+    "no entanto",
+    "por outro lado",
+    "por isso",
+})
+
+# Short function words whose accidental repetition ("que que") is collapsed.
+CONNECTOR_WORDS = (
+    "a",
+    "as",
+    "com",
+    "da",
+    "das",
+    "de",
+    "do",
+    "dos",
+    "e",
+    "ela",
+    "ele",
+    "em",
+    "eu",
+    "isso",
+    "na",
+    "nas",
+    "no",
+    "nos",
+    "o",
+    "os",
+    "para",
+    "por",
+    "pra",
+    "que",
+    "se",
+    "um",
+    "uma",
+)
+
+
+# Whitespace between repeated words: a stutter may wrap onto the next line,
+# but a blank line ends the paragraph ("... pra ele\n\nele respondeu").
+_WORD_GAP = r"(?:[^\S\n]+|[^\S\n]*\n[^\S\n]*)"
+
+
+def _build_connector_pattern() -> re.Pattern[str]:
+    # One alternation for every connector; a repeated run such as
+    # "que que que" collapses in a single match.
+    alternation = "|".join(sorted(CONNECTOR_WORDS, key=len, reverse=True))
+    return re.compile(rf"\b({alternation})(?:{_WORD_GAP}\1\b)+", re.IGNORECASE)
+
+
+def _build_duplicate_phrase_patterns() -> List[re.Pattern[str]]:
+    return [
+        re.compile(
+            rf"\b(?P<phrase>[{WORD_CHARS}]{{2,}}(?:{_WORD_GAP}[{WORD_CHARS}]{{2,}}){{1,3}})"
+            rf"{_WORD_GAP}(?P=phrase)\b",
+            re.IGNORECASE,
+        )
+    ]
+
 
-from .term_matching import CORRECTIONS_MAP, find_best_match as _tm_find_best_match
-from .utils import get_global_cache
+def _build_sentence_break_index() -> Dict[str, List[Tuple[str, ...]]]:
+    # Markers bucketed by their first token, so each position only tries
+    # the markers that can actually start there.
+    index: Dict[str, List[Tuple[str, ...]]] = {}
+    for marker_tokens in SENTENCE_BREAK_MARKERS:
+        index.setdefault(marker_tokens[0], []).append(marker_tokens)
+    return index
 
-WORD_CHARS = r"A-Za-zÀ-ÿ0-9"
+
+# Built once at import and shared by every TranscriptRefinementSystem.
+_CONNECTOR_PATTERN = _build_connector_pattern()
+_DUPLICATE_PHRASE_PATTERNS = _build_duplicate_phrase_patterns()
+_SENTENCE_BREAK_INDEX = _build_sentence_break_index()
 
 
 class TranscriptRefinementSystem:
     """Apply conservative deterministic cleanup before LLM refinement."""
 
     def __init__(self) -> None:
-        self._phrase_patterns = self._build_phrase_patterns()
-        self._connector_patterns = self._build_connector_patterns()
-        self._duplicate_phrase_patterns = self._build_duplicate_phrase_patterns()
-        self._sentence_break_markers = [
-            ("mas",),
-            ("porém",),
-            ("então",),
-            ("depois",),
-            ("agora",),
-            ("daí",),
-            ("no", "entanto"),
-            ("só", "que"),
-            ("por", "isso"),
-            ("nesse", "ponto"),
-            ("além", "disso"),
-            ("por", "outro", "lado"),
-        ]
-        self._paragraph_start_markers = {
-            "agora",
-            "além disso",
-            "daí",
-            "depois",
-            "nesse ponto",
-            "no entanto",
-            "por outro lado",
-            "por isso",
-        }
-
-    def _build_phrase_patterns(self) -> List[Tuple[str, str, re.Pattern[str]]]:
-        patterns: List[Tuple[str, str, re.Pattern[str]]] = []
-        for original, replacement in sorted(
-            CORRECTIONS_MAP.items(),
-            key=lambda item: len(item[0]),
-            reverse=True,
-        ):
-            pattern = re.compile(
-                rf"(?<![{WORD_CHARS}]){re.escape(original)}(?![{WORD_CHARS}])",
-                re.IGNORECASE,
-            )
-            patterns.append((original, replacement, pattern))
-        return patterns
-
-    def _build_connector_patterns(self) -> List[Tuple[str, re.Pattern[str]]]:
-        connectors = [
-            "a",
-            "as",
-            "da",
-            "das",
-            "de",
-            "do",
-            "dos",
-            "e",
-            "na",
-            "nas",
-            "no",
-            "nos",
-            "o",
-            "os",
-            "para",
-            "pra",
-            "que",
-        ]
-        return [
-            (
-                connector,
-                re.compile(
-                    rf"\b({connector})\s+\1\b",
-                    re.IGNORECASE,
-                ),
-            )
-            for connector in connectors
-        ]
-
-    def _build_duplicate_phrase_patterns(self) -> List[re.Pattern[str]]:
-        return [
-            re.compile(
-                rf"\b(?P<phrase>[{WORD_CHARS}]{{2,}}(?:\s+[{WORD_CHARS}]{{2,}}){{1,3}})\s+(?P=phrase)\b",
-                re.IGNORECASE,
-            )
-        ]
-
-    def _preserve_case(self, original: str, replacement: str) -> str:
-        if " " in replacement:
-            return replacement
-        if original.isupper():
-            return replacement.upper()
-        if original.istitle():
-            return replacement.capitalize()
-        return replacement
-
-    def _apply_targeted_corrections(self, text: str, corrections: List[Dict[str, object]]) -> str:
-        updated_text = text
-        for _, replacement, pattern in self._phrase_patterns:
-            def repl(match: re.Match[str]) -> str:
-                matched = match.group(0)
-                corrected = self._preserve_case(matched, replacement)
-                corrections.append(
-                    {
-                        "original": matched,
-                        "corrected": corrected,
-                        "position": match.start(),
-                    }
-                )
-                return corrected
-
-            updated_text = pattern.sub(repl, updated_text)
-        return updated_text
+        self._phrase_pattern = CORRECTIONS_PATTERN
+        self._connector_pattern = _CONNECTOR_PATTERN
+        self._duplicate_phrase_patterns = _DUPLICATE_PHRASE_PATTERNS
+        self._sentence_break_index = _SENTENCE_BREAK_INDEX
+        self._paragraph_start_markers = PARAGRAPH_START_MARKERS
+
+    def _apply_targeted_corrections(self, text: str, corrections: List[Correction]) -> str:
+        if not has_correction_candidates(text):
+            return text
+
+        def repl(match: re.Match[str]) -> str:
+            matched = match.group(0)
+            corrected = corrected_form(matched)
+            corrections.append(Correction(matched, corrected, match.start()))
+            return corrected
+
+        return self._phrase_pattern.sub(repl, text)
+
+    def _apply_duplicate_phrase_cleanup(self, text: str, corrections: List[Correction]) -> str:
+        def repl(match: re.Match[str]) -> str:
+            phrase = match.group("phrase")
+            corrections.append(Correction(match.group(0), phrase, match.start()))
+            return phrase
 
-    def _apply_duplicate_phrase_cleanup(self, text: str, corrections: List[Dict[str, object]]) -> str:
         updated_text = text
         for pattern in self._duplicate_phrase_patterns:
-            while True:
-                match = pattern.search(updated_text)
-                if not match:
-                    break
-                phrase = match.group("phrase")
-                corrections.append(
-                    {
-                        "original": match.group(0),
-                        "corrected": phrase,
-                        "position": match.start(),
-                    }
-                )
-                updated_text = updated_text[: match.start()] + phrase + updated_text[match.end() :]
+            # Each pass collapses every non-overlapping repeat in one scan; another
+            # pass only runs when a collapse exposed a new repeat (e.g. "a b a b a b").
+            replaced = 1
+            while replaced:
+                updated_text, replaced = pattern.subn(repl, updated_text)
         return updated_text
 
-    def _apply_connector_cleanup(self, text: str, corrections: List[Dict[str, object]]) -> str:
-        updated_text = text
-        for connector, pattern in self._connector_patterns:
-            while True:
-                match = pattern.search(updated_text)
-                if not match:
-                    break
-                corrected = match.group(1)
-                corrections.append(
-                    {
-                        "original": match.group(0),
-                        "corrected": corrected,
-                        "position": match.start(),
-                    }
-                )
-                updated_text = updated_text[: match.start()] + corrected + updated_text[match.end() :]
-        return updated_text
+    def _apply_connector_cleanup(self, text: str, corrections: List[Correction]) -> str:
+        def repl(match: re.Match[str]) -> str:
+            corrected = match.group(1)
+            corrections.append(Correction(match.group(0), corrected, match.start()))
+            return corrected
 
-    def _match_marker(self, tokens: List[str], index: int) -> Optional[Tuple[str, int]]:
-        for marker_tokens in self._sentence_break_markers:
+        return self._connector_pattern.sub(repl, text)
+
+    def _match_marker(self, normalized_tokens: List[str], index: int) -> Optional[Tuple[str, int]]:
+        for marker_tokens in self._sentence_break_index.get(normalized_tokens[index], ()):
             end_index = index + len(marker_tokens)
-            if end_index > len(tokens):
-                continue
-            normalized = [
-                re.sub(rf"^[^{WORD_CHARS}]+|[^{WORD_CHARS}]+$", "", token).lower()
-                for token in tokens[index:end_index]
-            ]
-            if tuple(normalized) == marker_tokens:
+            if tuple(normalized_tokens[index:end_index]) == marker_tokens:
                 return (" ".join(marker_tokens), len(marker_tokens))
         return None
 
     def _infer_sentence_breaks(self, text: str) -> str:
-        paragraph = re.sub(r"\s+", " ", text).strip()
+        # str.split() collapses whitespace runs and trims in one C-level pass.
+        paragraph = " ".join(text.split())
         if not paragraph:
             return ""
-        if re.search(r"[.!?]", paragraph):
+        if _SENTENCE_END_PATTERN.search(paragraph):
             return paragraph
 
         tokens = paragraph.split(" ")
+        normalized_tokens = [_EDGE_PUNCTUATION_PATTERN.sub("", token).lower() for token in tokens]
         rebuilt: List[str] = []
         words_since_break = 0
 
         for index, token in enumerate(tokens):
-            marker_match = self._match_marker(tokens, index)
+            marker_match = self._match_marker(normalized_tokens, index)
             if (
                 marker_match
                 and rebuilt
@@ -195,7 +203,8 @@ class TranscriptRefinementSystem:
                 words_since_break = 0
 
             rebuilt.append(token)
-            if re.search(rf"[{WORD_CHARS}]", token):
+            # Edge stripping leaves a token empty only when it has no word characters.
+            if normalized_tokens[index]:
                 words_since_break += 1
             if token.endswith((".", "!", "?")):
                 words_since_break = 0
@@ -206,26 +215,21 @@ class TranscriptRefinementSystem:
         return " ".join(rebuilt)
 
     def _capitalize_sentences(self, text: str) -> str:
-        capitalized = re.sub(
-            r"(^|(?<=[.!?]\s))([a-zà-ÿ])",
+        capitalized = _SENTENCE_START_PATTERN.sub(
             lambda match: match.group(1) + match.group(2).upper(),
             text,
-            flags=re.IGNORECASE,
         )
         return capitalized.strip()
 
     def _split_sentences(self, text: str) -> List[str]:
-        return [
-            sentence.strip()
-            for sentence in re.findall(r"[^.!?]+[.!?]?", text)
-            if sentence.strip()
-        ]
+        sentences = (match.group().strip() for match in _SENTENCE_PATTERN.finditer(text))
+        return [sentence for sentence in sentences if sentence]
 
     def _format_paragraphs(self, text: str) -> str:
         source_paragraphs = [
-            paragraph.strip()
-            for paragraph in re.split(r"\n\s*\n+", text.strip())
-            if paragraph.strip()
+            paragraph
+            for paragraph in map(str.strip, _PARAGRAPH_BREAK_PATTERN.split(text.strip()))
+            if paragraph
         ] or [text.strip()]
 
         formatted_paragraphs: List[str] = []
@@ -265,33 +269,25 @@ class TranscriptRefinementSystem:
 
         return "\n\n".join(paragraph for paragraph in formatted_paragraphs if paragraph).strip()
 
-    def find_and_correct_terms(self, text: str) -> Tuple[str, List[Dict[str, object]]]:
+    def find_and_correct_terms(self, text: str) -> Tuple[str, List[Correction]]:
         """Apply transcript-focused deterministic cleanup with caching."""
         cache = get_global_cache()
         cached_result = cache.get_transcript_corrections(text)
         if cached_result:
             return cached_result["corrected_text"], cached_result["corrections"]
 
-        corrections: List[Dict[str, object]] = []
+        corrections: List[Correction] = []
         corrected_text = text
         corrected_text = self._apply_targeted_corrections(corrected_text, corrections)
         corrected_text = self._apply_duplicate_phrase_cleanup(corrected_text, corrections)
         corrected_text = self._apply_connector_cleanup(corrected_text, corrections)
         structured_text = self._format_paragraphs(corrected_text)
         if structured_text != corrected_text:
-            corrections.append(
-                {
-                    "original": corrected_text,
-                    "corrected": structured_text,
-                    "position": 0,
-                }
-            )
+            corrections.append(Correction(corrected_text, structured_text, 0))
             corrected_text = structured_text
 
         cache.set_transcript_corrections(text, corrected_text, corrections)
 
-        from .utils import get_performance_monitor
-
         get_performance_monitor().record_transcript_corrections(len(corrections))
         return corrected_text, corrections
 
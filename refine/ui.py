@@ -24,9 +24,10 @@ def show_processing_complete(filename: str):
 
 def show_success_message(files: List[str]):
     """Show success message."""
-    print(f"\\n🎉 Processing complete! Output files:")
-    for file in files:
-        print(f"  📁 output/refined_{file}")
+    # One write for the whole listing instead of one per file.
+    lines = ["\\n🎉 Processing complete! Output files:"]
+    lines.extend(f"  📁 output/refined_{file}" for file in files)
+    print("\n".join(lines))
 
 
 def show_exit_message():
@@ -2,18 +2,69 @@
 
 import os
 import re
+import sys
+import tempfile
+import threading
+import json
 import hashlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Set, TextIO, Tuple
 from functools import lru_cache
 import time
 
+if TYPE_CHECKING:  # transcript_refinement imports this module at load time
+    from .transcript_refinement import Correction
+
 
 NOISE_MARKER_PATTERN = re.compile(
     r"(\[|\()\s*(?:m[uú]sica|risos|aplausos|inaud[ií]vel|sil[eê]ncio|tosse|barulho|noise|laughter)\s*(?:\]|\))",
     re.IGNORECASE,
 )
 
+# Whitespace tidying shared by remove_timestamps and remove_noise_markers.
+# A lone space is already normalized, so only runs of two or more match.
+SPACE_RUN_PATTERN = re.compile(r" {2,}")
+LINE_INDENT_PATTERN = re.compile(r"\n[ \t]+")
+
+# A blank line (optionally holding whitespace) separates paragraphs; longer
+# runs of newlines are covered by the trailing ``\s*``.
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\s*\n\s*")
+
+# Extensions picked up from the input folder (str.endswith accepts a tuple).
+INPUT_FILE_SUFFIXES = (".txt",)
+
+# clean_text passes, compiled once instead of looked up on every call.
+# Only horizontal space around the newline: the two quantifiers cannot
+# overlap (no backtracking blow-up) and a blank line is never joined across.
+# The word characters on either side are lookarounds rather than captured
+# ``\w+`` runs, so a long word is not rescanned from each of its letters
+# and consecutive breaks ("a-\nb-\nc") are all joined.
+HYPHEN_BREAK_PATTERN = re.compile(r"(?<=\w)-[ \t]*\n[ \t]*(?=\w)")
+# Starts with a literal, so the engine jumps straight to each "-"; used to
+# skip the hyphen pass on the common input with no hyphen at a line end.
+HYPHEN_LINE_END_PATTERN = re.compile(r"-[ \t]*\n")
+HORIZONTAL_SPACE_PATTERN = re.compile(r"[ \t]+")
+# The lookbehind anchors each attempt at the start of a whitespace run, so a
+# long run that is not followed by punctuation is scanned once, not once per
+# character (which was quadratic on blank-line-heavy input).
+SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r"(?<!\s)\s+([,.;:!?])")
+MISSING_SPACE_AFTER_PUNCTUATION_PATTERN = re.compile(r"([,.;:!?])([^\s\n,.;:!?])")
+REPEATED_PUNCTUATION_PATTERN = re.compile(r"([!?.,;:]){2,}")
+BLANK_LINE_RUN_PATTERN = re.compile(r"(\n\s*){3,}")
+
+# Line-leading timestamps ("00:42 ", "[01:02:51] - "), repeated stamps included,
+# in one pass. A line left holding only timestamps is removed with its newline.
+# Spacing is matched within the line only ([^\S\n] is whitespace other than
+# "\n"), so blank lines around a timestamp survive and a long blank run is
+# not rescanned from every line start.
+_TIMESTAMP = r"(?:\[[^\S\n]*)?\d{1,2}:\d{2}(?::\d{2})?(?:[^\S\n]*\])?"
+TIMESTAMP_LINE_PATTERN = re.compile(
+    rf"^[^\S\n]*{_TIMESTAMP}(?:[^\S\n]*{_TIMESTAMP})*"
+    r"(?:[^\S\n]*$\n?|[^\S\n]*(?:[-–][^\S\n]*)?)",
+    re.MULTILINE,
+)
+
 
 # Text processing functions
 def remove_timestamps(text: str) -> str:
@@ -29,36 +80,26 @@ def remove_timestamps(text: str) -> str:
     if not text:
         return ""
 
-    # Remove timestamps at the beginning of lines.
-    text = re.sub(
-        r"^\s*(?:\[\s*)?(?:\d{1,2}:\d{2}(?::\d{2})?)(?:\s*\])?\s*(?:[-–]\s*)?",
-        "",
-        text,
-        flags=re.MULTILINE,
-    )
-
-    # Remove standalone timestamps that might be on their own lines.
-    text = re.sub(
-        r"^\s*(?:\[\s*)?(?:\d{1,2}:\d{2}(?::\d{2})?)(?:\s*\])?\s*$",
-        "",
-        text,
-        flags=re.MULTILINE,
-    )
-
-    text = re.sub(r" +", " ", text)
-    text = re.sub(r"\n[ \t]+", "\n", text)
+    text = _strip_timestamp_lines(text)
+    text = SPACE_RUN_PATTERN.sub(" ", text)
+    text = LINE_INDENT_PATTERN.sub("\n", text)
 
     return text.strip()
 
 
+def _strip_timestamp_lines(text: str) -> str:
+    """Drop line-leading and standalone timestamps without touching whitespace."""
+    return TIMESTAMP_LINE_PATTERN.sub("", text)
+
+
 def remove_noise_markers(text: str) -> str:
     """Remove common bracketed non-speech markers from transcripts."""
     if not text:
         return ""
 
     text = NOISE_MARKER_PATTERN.sub(" ", text)
-    text = re.sub(r" {2,}", " ", text)
-    text = re.sub(r"\n[ \t]+", "\n", text)
+    text = SPACE_RUN_PATTERN.sub(" ", text)
+    text = LINE_INDENT_PATTERN.sub("\n", text)
     return text.strip()
 
 
@@ -76,33 +117,76 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    text = remove_timestamps(text)
-    text = remove_noise_markers(text)
+    # The standalone helpers also normalize whitespace; clean_text does that
+    # itself below, so only their removal passes run here.
+    text = _strip_timestamp_lines(text)
+    # Their full strip() still applies: it also trims NBSP, form feed and NEL,
+    # which the later passes leave alone.
+    text = NOISE_MARKER_PATTERN.sub(" ", text).strip()
 
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    text = re.sub(r"(\w+)-\s*\n\s*(\w+)", r"\1\2", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\s+([,.;:!?])", r"\1", text)
-    text = re.sub(r"([,.;:!?])([^\s\n,.;:!?])", r"\1 \2", text)
-    text = re.sub(r"([!?.,;:]){2,}", r"\1", text)
+    if HYPHEN_LINE_END_PATTERN.search(text):
+        text = HYPHEN_BREAK_PATTERN.sub("", text)
+    text = HORIZONTAL_SPACE_PATTERN.sub(" ", text)
+    text = SPACE_BEFORE_PUNCTUATION_PATTERN.sub(r"\1", text)
+    text = MISSING_SPACE_AFTER_PUNCTUATION_PATTERN.sub(r"\1 \2", text)
+    text = REPEATED_PUNCTUATION_PATTERN.sub(r"\1", text)
 
-    lines = [re.sub(r"\s+$", "", line).strip(" ") for line in text.split("\n")]
+    # str.rstrip() drops the same characters as a trailing \s+ regex.
+    lines = [line.rstrip().lstrip(" ") for line in text.split("\n")]
     text = "\n".join(lines)
 
-    text = re.sub(r"(\n\s*){3,}", "\n\n", text)
+    text = BLANK_LINE_RUN_PATTERN.sub("\n\n", text)
 
     return text.strip("\n")
 
 
 def split_into_paragraphs(text: str) -> List[str]:
     """Split text into paragraphs while preserving structure."""
-    # Handle different paragraph markers: double newlines, triple newlines, etc.
-    paragraphs = re.split(r'\n\s*\n\s*|\n{3,}', text.strip())
-    return [p.strip() for p in paragraphs if p.strip()]
+    paragraphs = PARAGRAPH_SPLIT_PATTERN.split(text.strip())
+    return [p for p in map(str.strip, paragraphs) if p]
+
+
+@lru_cache(maxsize=8)
+def _word_run_pattern(max_words: int) -> re.Pattern[str]:
+    return re.compile(rf"\S+(?:\s+\S+){{0,{max_words - 1}}}")
+
+
+def split_into_chunks(text: str, max_words: int = 800) -> List[str]:
+    """Pack consecutive paragraphs into chunks of at most ``max_words`` words.
+
+    Paragraph breaks are kept inside each chunk. A paragraph longer than
+    ``max_words`` is split on word boundaries into its own chunks.
+    """
+    if max_words < 1:
+        raise ValueError("max_words must be at least 1")
+
+    chunks: List[str] = []
+    current_chunk: List[str] = []
+    current_words = 0
+
+    for paragraph in split_into_paragraphs(text):
+        paragraph_words = len(paragraph.split())
+
+        if current_chunk and current_words + paragraph_words > max_words:
+            chunks.append('\n\n'.join(current_chunk))
+            current_chunk = []
+            current_words = 0
 
+        if paragraph_words > max_words:
+            # Each match is a run of up to max_words words sliced straight out
+            # of the paragraph, so no per-word list or re-join is built.
+            chunks.extend(_word_run_pattern(max_words).findall(paragraph))
+            continue
 
-# Note: All chunking helpers removed to simplify processing into single-pass
+        current_chunk.append(paragraph)
+        current_words += paragraph_words
+
+    if current_chunk:
+        chunks.append('\n\n'.join(current_chunk))
+
+    return chunks
 
 
 def reconstruct_with_paragraphs(paragraphs: List[str]) -> str:
@@ -117,30 +201,40 @@ def word_count(text: str) -> int:
 
 def is_valid_text(text: str) -> bool:
     """Check if text is valid for processing."""
-    return bool(text and text.strip() and len(text.strip()) > 10)
+    return bool(text) and len(text.strip()) > 10
 
 
 # File operations functions
 def list_input_files(input_dir: str = "input") -> List[str]:
     """List all .txt files in the input folder."""
-    input_folder = Path(input_dir)
-    
-    if not input_folder.exists():
+    try:
+        with os.scandir(input_dir) as entries:
+            # The name test runs first; is_file() then answers from the cached
+            # d_type on most filesystems and only stats symlinks (or entries on
+            # filesystems that report no type).
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(INPUT_FILE_SUFFIXES) and entry.is_file()
+            ]
+    except FileNotFoundError:
         print(f"❌ Folder '{input_dir}' not found")
         return []
-    
-    txt_files = list(input_folder.glob("*.txt"))
-    return [f.name for f in txt_files]
+    except OSError as e:
+        print(f"❌ Cannot read folder '{input_dir}': {e}")
+        return []
 
 
 def list_output_files(output_dir: str = "output") -> List[str]:
     """List all files in the output folder."""
-    output_folder = Path(output_dir)
-    
-    if not output_folder.exists():
+    try:
+        # DirEntry carries the name and file type from the directory read, so
+        # no Path objects or per-entry stat calls are needed.
+        with os.scandir(output_dir) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+    except OSError:
+        # Missing, not a directory, or unreadable: nothing to list.
         return []
-    
-    return [f.name for f in output_folder.iterdir() if f.is_file()]
 
 
 def read_text_file(file_path: str, encoding: str = "utf-8") -> str:
@@ -157,9 +251,20 @@ def write_text_file(file_path: str, content: str, encoding: str = "utf-8") -> bo
     """Write text content to a file."""
     try:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w', encoding=encoding) as f:
+        directory = os.path.dirname(file_path)
+        if directory:
+            ensure_directories(directory)
+
+        try:
+            f = open(file_path, 'w', encoding=encoding)
+        except FileNotFoundError:
+            if not directory:
+                raise
+            # The directory was removed after it was first ensured; recreate it.
+            _ensured_dirs.discard(directory)
+            ensure_directories(directory)
+            f = open(file_path, 'w', encoding=encoding)
+        with f:
             f.write(content)
         return True
     except Exception as e:
@@ -172,97 +277,150 @@ def generate_output_filename(input_filename: str) -> str:
     return f"refined_{input_filename}"
 
 
+# Directories already created (or found) this run; skips the makedirs stat
+# cascade on every write in a batch.
+_ensured_dirs: Set[str] = set()
+
+
 def ensure_directories(*dirs: str) -> None:
     """Ensure directories exist."""
     for dir_path in dirs:
-        os.makedirs(dir_path, exist_ok=True)
+        if dir_path not in _ensured_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            _ensured_dirs.add(dir_path)
 
 
 # Caching system for performance optimization
+CacheKey = Tuple[str, str, str]
+
+
 class TextProcessingCache:
     """LRU cache for text processing operations."""
 
-    def __init__(self, max_size: int = 100):
+    def __init__(self, max_size: int = 100, max_bytes: int = 64 << 20):
         self.max_size = max_size
-        self._llm_cache: Dict[str, Dict[str, Any]] = {}
-        self._transcript_cache: Dict[str, Dict[str, Any]] = {}
-        self._access_times: Dict[str, float] = {}
-
-    def _get_cache_key(self, text: str, operation: str, model: str = "") -> str:
+        # Entries hold whole chunks, so the entry count alone does not bound
+        # memory; both caches also share a byte budget. Entry sizes are kept in
+        # recency order across both caches, so the budget evicts whichever
+        # entry was used least recently, not just entries of the cache written.
+        self.max_bytes = max_bytes
+        self._bytes_used = 0
+        self._entry_sizes: "OrderedDict[CacheKey, int]" = OrderedDict()
+        # Insertion order doubles as recency order: hits move to the end and
+        # eviction pops from the front, both in O(1).
+        self._llm_cache: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._transcript_cache: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        # Shared by concurrent file and chunk workers: a lookup's get and
+        # move_to_end, and a store's size bookkeeping, must not interleave
+        # with another thread's eviction.
+        self._lock = threading.Lock()
+
+    def _get_cache_key(self, text: str, operation: str, model: str = "") -> CacheKey:
         """Generate a cache key from text and operation."""
-        content = f"{text}:{operation}:{model}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
-
-    def _cleanup_cache(self, cache_dict: Dict[str, Dict[str, Any]]) -> None:
-        """Remove oldest entries if cache exceeds max size."""
-        if len(cache_dict) >= self.max_size:
-            # Remove oldest 20% of entries
-            to_remove = int(self.max_size * 0.2)
-            sorted_keys = sorted(self._access_times.items(), key=lambda x: x[1])
-            for key, _ in sorted_keys[:to_remove]:
-                if key in cache_dict:
-                    del cache_dict[key]
-                if key in self._access_times:
-                    del self._access_times[key]
+        # A tuple hashes from the strings' own cached hashes and compares by
+        # equality, so there is no digest to compute and no collisions; the
+        # key only references ``text`` rather than copying it.
+        return (operation, model, text)
+
+    def _store(
+        self,
+        cache_dict: "OrderedDict[CacheKey, Dict[str, Any]]",
+        key: CacheKey,
+        entry: Dict[str, Any],
+        size: int,
+    ) -> None:
+        """Insert an entry as most recent and drop the least recent overflow.
+
+        The newest entry is always kept, even when it alone exceeds max_bytes.
+        """
+        with self._lock:
+            if key in cache_dict:
+                self._bytes_used -= self._entry_sizes[key]
+            cache_dict[key] = entry
+            cache_dict.move_to_end(key)
+            self._entry_sizes[key] = size
+            self._entry_sizes.move_to_end(key)
+            self._bytes_used += size
+            while len(cache_dict) > self.max_size:
+                old_key, _ = cache_dict.popitem(last=False)
+                self._bytes_used -= self._entry_sizes.pop(old_key)
+            while self._bytes_used > self.max_bytes and len(self._entry_sizes) > 1:
+                old_key, old_size = self._entry_sizes.popitem(last=False)
+                self._cache_for(old_key).pop(old_key)
+                self._bytes_used -= old_size
+
+    def _cache_for(self, key: CacheKey) -> "OrderedDict[CacheKey, Dict[str, Any]]":
+        return self._llm_cache if key[0] == "llm" else self._transcript_cache
 
     def get_llm_response(self, text: str, model: str) -> Optional[str]:
         """Get cached LLM response if available."""
         key = self._get_cache_key(text, "llm", model)
-        if key in self._llm_cache:
-            self._access_times[key] = time.time()
-            return self._llm_cache[key]['response']
-        return None
+        with self._lock:
+            entry = self._llm_cache.get(key)
+            if entry is None:
+                return None
+            self._llm_cache.move_to_end(key)
+            self._entry_sizes.move_to_end(key)
+        return entry['response']
 
     def set_llm_response(self, text: str, model: str, response: str) -> None:
         """Cache LLM response."""
         key = self._get_cache_key(text, "llm", model)
-        self._cleanup_cache(self._llm_cache)
-        self._llm_cache[key] = {
+        self._store(self._llm_cache, key, {
             'response': response,
             'timestamp': time.time()
-        }
-        self._access_times[key] = time.time()
+        }, sys.getsizeof(text) + sys.getsizeof(response))
 
     def get_transcript_corrections(self, text: str) -> Optional[Dict[str, Any]]:
         """Get cached deterministic transcript corrections if available."""
         key = self._get_cache_key(text, "transcript")
-        if key in self._transcript_cache:
-            self._access_times[key] = time.time()
-            return self._transcript_cache[key]
-        return None
-
-    def set_transcript_corrections(self, text: str, corrected_text: str, corrections: List[Dict]) -> None:
+        with self._lock:
+            entry = self._transcript_cache.get(key)
+            if entry is None:
+                return None
+            self._transcript_cache.move_to_end(key)
+            self._entry_sizes.move_to_end(key)
+        return entry
+
+    def set_transcript_corrections(self, text: str, corrected_text: str, corrections: "List[Correction]") -> None:
         """Cache deterministic transcript corrections."""
         key = self._get_cache_key(text, "transcript")
-        self._cleanup_cache(self._transcript_cache)
-        self._transcript_cache[key] = {
+        # Corrections carry text too (the paragraph pass records a full copy).
+        size = sys.getsizeof(text) + sys.getsizeof(corrected_text) + sum(
+            sys.getsizeof(item.original) + sys.getsizeof(item.corrected)
+            for item in corrections
+        )
+        self._store(self._transcript_cache, key, {
             "corrected_text": corrected_text,
             "corrections": corrections,
             "timestamp": time.time(),
-        }
-        self._access_times[key] = time.time()
+        }, size)
 
     # Compatibility aliases for the older terminology.
     def get_bp_corrections(self, text: str) -> Optional[Dict[str, Any]]:
         return self.get_transcript_corrections(text)
 
-    def set_bp_corrections(self, text: str, corrected_text: str, corrections: List[Dict]) -> None:
+    def set_bp_corrections(self, text: str, corrected_text: str, corrections: "List[Correction]") -> None:
         self.set_transcript_corrections(text, corrected_text, corrections)
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
-        self._llm_cache.clear()
-        self._transcript_cache.clear()
-        self._access_times.clear()
+        with self._lock:
+            self._llm_cache.clear()
+            self._transcript_cache.clear()
+            self._entry_sizes.clear()
+            self._bytes_used = 0
 
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
-        return {
-            "llm_cache_size": len(self._llm_cache),
-            "transcript_cache_size": len(self._transcript_cache),
-            "bp_cache_size": len(self._transcript_cache),
-            "total_cache_entries": len(self._llm_cache) + len(self._transcript_cache),
-        }
+        with self._lock:
+            return {
+                "llm_cache_size": len(self._llm_cache),
+                "transcript_cache_size": len(self._transcript_cache),
+                "bp_cache_size": len(self._transcript_cache),
+                "total_cache_entries": len(self._llm_cache) + len(self._transcript_cache),
+                "bytes_used": self._bytes_used,
+            }
 
 
 # Global cache instance
@@ -274,13 +432,102 @@ def get_global_cache() -> TextProcessingCache:
     return _text_cache
 
 
+# Optional on-disk cache for results that survive between runs
+class DiskCache:
+    """JSON-file cache keyed by a content hash, enabled with TXTREFINE_LLM_CACHE=1."""
+
+    def __init__(self, namespace: str, base_dir: Optional[str] = None):
+        self.namespace = namespace
+        self.base_dir = base_dir
+
+    @property
+    def cache_dir(self) -> Path:
+        base_dir = (
+            self.base_dir
+            or os.getenv("TXTREFINE_CACHE_DIR")
+            or os.path.join(os.path.expanduser("~"), ".cache", "txtrefine")
+        )
+        return Path(base_dir) / self.namespace
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check the opt-in flag on each call so it can be toggled at runtime."""
+        return os.getenv("TXTREFINE_LLM_CACHE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the key parts with blake2b, which is fast and collision-safe."""
+        digest = hashlib.blake2b(digest_size=20)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or ``None`` on a miss or unreadable entry."""
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value; cache write failures are ignored."""
+        tmp_path = None
+        try:
+            cache_dir = self.cache_dir
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write, so threads and processes storing
+            # the same key never share one; os.replace publishes it atomically.
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_dir / f"{key}.json")
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+_disk_caches: Dict[str, DiskCache] = {}
+
+
+def get_disk_cache(namespace: str) -> DiskCache:
+    """Get the shared on-disk cache for a namespace."""
+    if namespace not in _disk_caches:
+        _disk_caches[namespace] = DiskCache(namespace)
+    return _disk_caches[namespace]
+
+
 @lru_cache(maxsize=50)
 def cached_clean_text(text: str) -> str:
     """Cached version of clean_text for repeated identical inputs."""
     return clean_text(text)
 
 
+def _reset_text_stats(stats: Dict[str, int]) -> None:
+    stats.update(characters=0, words=0, content_characters=0)
+
+
+def _add_text_stats(stats: Dict[str, int], text: str) -> int:
+    """Add ``text`` to running input counts; returns its word count."""
+    words = text.split()
+    stats["characters"] += len(text)
+    stats["words"] += len(words)
+    stats["content_characters"] += sum(map(len, words))
+    return len(words)
+
+
 # Memory-efficient streaming processor for large files
+# Read buffer for streamed files: one raw read covers several chunks instead
+# of the default 8 KiB buffer refilling a dozen times per chunk.
+STREAM_READ_BUFFER = 1 << 20
+
+
 class StreamingTextProcessor:
     """Process large text files in chunks to reduce memory usage."""
 
@@ -288,44 +535,52 @@ class StreamingTextProcessor:
         self.chunk_size = chunk_size
         self.cache = get_global_cache()
 
-    def process_large_file(self, file_path: str, model: str = "llama3.2:latest") -> str:
+    def process_large_file(self, file_path: str, model: str = "llama3.2:latest",
+                           file_size: Optional[int] = None,
+                           stats: Optional[Dict[str, int]] = None) -> str:
         """
         Process a large file by streaming it in chunks.
         This reduces memory usage for very large files.
+        Returns the cleaned and refined text.
+        Pass ``file_size`` when the caller already stat'ed the file.
+        Pass a ``stats`` dict to receive the input's ``characters``, ``words``
+        and ``content_characters`` (non-whitespace), counted while reading so
+        the caller never has to load the whole file itself.
         """
+        if stats is None:
+            stats = {}
         print(f"📄 Processing large file: {os.path.basename(file_path)}")
 
         # Check if file is actually large enough to warrant streaming
-        file_size = os.path.getsize(file_path)
+        if file_size is None:
+            file_size = os.path.getsize(file_path)
         if file_size < self.chunk_size * 2:
             # File is small enough, use regular processing
-            return read_text_file(file_path)
+            return self._process_whole_file(file_path, model, stats)
 
         print(f"📊 File size: {file_size / 1024:.1f} KB - using streaming mode")
 
         processed_chunks = []
         chunk_count = 0
+        _reset_text_stats(stats)
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                while True:
-                    # Read chunk
-                    chunk = f.read(self.chunk_size)
-                    if not chunk:
-                        break
-
+            with open(file_path, 'r', encoding='utf-8', buffering=STREAM_READ_BUFFER) as f:
+                for chunk in self._iter_paragraph_chunks(f):
                     chunk_count += 1
-                    print(f"   Processing chunk {chunk_count}...")
+                    # Whitespace-only chunks have nothing to refine.
+                    if not _add_text_stats(stats, chunk):
+                        continue
 
                     # Process the chunk
                     processed_chunk = self._process_chunk(chunk, model)
                     processed_chunks.append(processed_chunk)
 
-                    # Show progress
+                    # One progress line per chunk
                     print(f"   ✅ Chunk {chunk_count} completed")
 
-            # Combine all processed chunks
-            result = ''.join(processed_chunks)
+            # Chunks end on paragraph breaks, which cleanup strips; put them back.
+            result = '\n\n'.join(chunk for chunk in processed_chunks if chunk)
 
             print(f"🎉 Streaming processing complete - {chunk_count} chunks processed")
             return result
@@ -334,7 +589,53 @@ class StreamingTextProcessor:
             print(f"⚠️  Streaming processing failed: {e}")
             # Fallback to regular processing
             print("🔄 Falling back to regular processing...")
-            return read_text_file(file_path)
+            return self._process_whole_file(file_path, model, stats)
+
+    def _process_whole_file(self, file_path: str, model: str, stats: Dict[str, int]) -> str:
+        text = read_text_file(file_path)
+        _reset_text_stats(stats)
+        if not _add_text_stats(stats, text):
+            return ""
+        return self._process_chunk(text, model)
+
+    def _iter_paragraph_chunks(self, stream: TextIO) -> Iterator[str]:
+        """Yield chunks of about ``chunk_size`` characters read from ``stream``.
+
+        A chunk is cut at the first paragraph break after it reaches
+        ``chunk_size``. When none turns up before twice that size, it is cut at
+        the first line break (or else space) after ``chunk_size`` instead, so
+        a transcript written as a single line still streams in chunk-sized
+        pieces and words are not split.
+        """
+        pending = ""
+        while True:
+            block = stream.read(self.chunk_size)
+            if not block:
+                break
+            pending += block
+            while len(pending) >= self.chunk_size:
+                cut = self._find_chunk_cut(pending)
+                if cut is None:
+                    break
+                yield pending[:cut]
+                pending = pending[cut:]
+        if pending:
+            yield pending
+
+    def _find_chunk_cut(self, text: str) -> Optional[int]:
+        """Offset to cut ``text`` at, or ``None`` to wait for more input."""
+        paragraph_break = PARAGRAPH_SPLIT_PATTERN.search(text, self.chunk_size)
+        if paragraph_break:
+            return paragraph_break.end()
+        limit = self.chunk_size * 2
+        if len(text) < limit:
+            return None
+        for separator in ("\n", " "):
+            cut = text.find(separator, self.chunk_size, limit)
+            if cut != -1:
+                return cut + 1
+        # One unbroken run of ``limit`` characters: no word boundary to keep.
+        return limit
 
     def _process_chunk(self, chunk: str, model: str) -> str:
         """Process a single chunk with deterministic cleanup and LLM refinement."""
@@ -348,13 +649,29 @@ class StreamingTextProcessor:
 
         return refined_chunk
 
-    def should_use_streaming(self, file_path: str) -> bool:
+    def should_use_streaming(self, file_path: str, file_size: Optional[int] = None) -> bool:
         """Determine if streaming should be used for a file."""
-        try:
-            file_size = os.path.getsize(file_path)
-            return file_size > self.chunk_size * 2  # Use streaming for files > 2 chunks
-        except OSError:
-            return False
+        if file_size is None:
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError:
+                return False
+        return file_size > self.chunk_size * 2  # Use streaming for files > 2 chunks
+
+    def count_content_characters(self, file_path: str, limit: int) -> int:
+        """Count non-whitespace characters in a file, stopping once ``limit`` is reached.
+
+        Lets callers reject empty or near-empty large files before any chunk is
+        refined; real transcripts stop within the first block.
+        """
+        count = 0
+        with open(file_path, 'r', encoding='utf-8', buffering=STREAM_READ_BUFFER) as f:
+            while count < limit:
+                block = f.read(self.chunk_size)
+                if not block:
+                    break
+                count += sum(map(len, block.split()))
+        return min(count, limit)
 
 
 # Global streaming processor instance
@@ -461,22 +778,25 @@ class PerformanceMonitor:
         """Print a formatted performance summary."""
         summary = self.get_summary()
 
-        print("\n" + "=" * 60)
-        print("📊 PERFORMANCE SUMMARY")
-        print("=" * 60)
-        print(f"Total runtime: {summary['total_runtime_seconds']}s")
-        print(f"Files processed: {summary['files_processed']}")
-        print(f"Average file time: {summary['avg_file_processing_time']}s")
-        print(f"Processing speed: {summary['characters_per_second']} chars/sec")
-        print(f"Word processing: {summary['words_per_second']} words/sec")
-        print(f"Cache hit rate: {summary['cache_hit_rate']}%")
-        print(f"LLM calls: {summary['llm_calls']}")
-        print(f"Transcript corrections: {summary['transcript_corrections_applied']}")
+        lines = [
+            "\n" + "=" * 60,
+            "📊 PERFORMANCE SUMMARY",
+            "=" * 60,
+            f"Total runtime: {summary['total_runtime_seconds']}s",
+            f"Files processed: {summary['files_processed']}",
+            f"Average file time: {summary['avg_file_processing_time']}s",
+            f"Processing speed: {summary['characters_per_second']} chars/sec",
+            f"Word processing: {summary['words_per_second']} words/sec",
+            f"Cache hit rate: {summary['cache_hit_rate']}%",
+            f"LLM calls: {summary['llm_calls']}",
+            f"Transcript corrections: {summary['transcript_corrections_applied']}",
+        ]
         if summary['streaming_files'] > 0:
-            print(f"Streaming files: {summary['streaming_files']}")
+            lines.append(f"Streaming files: {summary['streaming_files']}")
         if summary['errors_encountered'] > 0:
-            print(f"Errors encountered: {summary['errors_encountered']}")
-        print("=" * 60)
+            lines.append(f"Errors encountered: {summary['errors_encountered']}")
+        lines.append("=" * 60)
+        print("\n".join(lines))
 
 
 # Global performance monitor instance
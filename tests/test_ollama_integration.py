@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -5,7 +7,9 @@ from refine.ollama_integration import (
     DETERMINISTIC_ONLY_MODEL,
     SYSTEM_PROMPT,
     build_refinement_prompt,
+    refine_text_with_paragraphs,
     single_pass_refine,
+    smart_chunk_text,
 )
 from refine.utils import get_global_cache
 
@@ -13,14 +17,19 @@ from refine.utils import get_global_cache
 class TestOllamaIntegration(unittest.TestCase):
     def setUp(self):
         get_global_cache().clear_cache()
+        # Keep mocked responses out of the developer's on-disk cache, and keep
+        # entries cached by real runs out of these tests.
+        environ = patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop("TXTREFINE_LLM_CACHE", None)
+        os.environ.pop("TXTREFINE_CACHE_DIR", None)
 
     @patch("refine.ollama_integration.ollama")
     def test_prompt_targets_readable_transcript_cleanup(self, mock_ollama):
-        mock_ollama.chat.return_value = {
-            "message": {
-                "content": "Texto revisado com pontuação."
-            }
-        }
+        mock_ollama.chat.return_value = iter([
+            {"message": {"content": "Texto revisado com pontuação."}}
+        ])
 
         single_pass_refine("texto bruto", model="llama3.2:latest")
 
@@ -38,11 +47,9 @@ class TestOllamaIntegration(unittest.TestCase):
 
     @patch("refine.ollama_integration.ollama")
     def test_content_loss_guard_keeps_deterministic_text(self, mock_ollama):
-        mock_ollama.chat.return_value = {
-            "message": {
-                "content": "Resumo curto"
-            }
-        }
+        mock_ollama.chat.return_value = iter([
+            {"message": {"content": "Resumo curto"}}
+        ])
 
         refined = single_pass_refine(
             "Essa é uma transcrição longa o suficiente para validar a proteção contra perda de conteúdo.",
@@ -54,6 +61,23 @@ class TestOllamaIntegration(unittest.TestCase):
             "Essa é uma transcrição longa o suficiente para validar a proteção contra perda de conteúdo.",
         )
 
+    @patch("refine.ollama_integration.ollama")
+    def test_runaway_stream_is_aborted(self, mock_ollama):
+        consumed = []
+
+        def runaway_stream():
+            for _ in range(100):
+                consumed.append(1)
+                yield {"message": {"content": "palavra "}}
+
+        mock_ollama.chat.return_value = runaway_stream()
+
+        refined = single_pass_refine("vamos abrir no microsof teams", model="llama3.2:latest")
+
+        self.assertEqual(refined, "Vamos abrir no Microsoft Teams.")
+        self.assertTrue(mock_ollama.chat.call_args.kwargs["stream"])
+        self.assertLess(len(consumed), 100)
+
     def test_build_refinement_prompt_mentions_rules(self):
         prompt = build_refinement_prompt("texto")
         self.assertIn("Do not summarize", prompt)
@@ -68,6 +92,137 @@ class TestOllamaIntegration(unittest.TestCase):
         )
         self.assertEqual(refined, "Vamos abrir no Microsoft Teams.")
 
+    @patch("refine.ollama_integration.REVIEW_MIN_WORDS", 0)
+    @patch("refine.ollama_integration.ollama")
+    def test_paragraph_refinement_preserves_order(self, mock_ollama):
+        def fake_chat(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            text = prompt.split("TEXT:\n", 1)[1].split("\n\nOUTPUT:", 1)[0]
+            return iter([{"message": {"content": text.upper()}}])
+
+        mock_ollama.chat.side_effect = fake_chat
+
+        refined = refine_text_with_paragraphs(
+            "primeiro bloco de texto.\n\nsegundo bloco de texto.\n\nterceiro bloco de texto.",
+            model="llama3.2:latest",
+            chunk_size=4,
+        )
+
+        self.assertEqual(
+            refined,
+            "PRIMEIRO BLOCO DE TEXTO.\n\nSEGUNDO BLOCO DE TEXTO.\n\nTERCEIRO BLOCO DE TEXTO.",
+        )
+        self.assertEqual(mock_ollama.chat.call_count, 3)
+
+    @patch("refine.ollama_integration.REVIEW_MIN_WORDS", 0)
+    @patch("refine.ollama_integration.ollama")
+    def test_repeated_chunks_are_refined_once(self, mock_ollama):
+        mock_ollama.chat.return_value = iter([{"message": {"content": "Bom dia a todos."}}])
+
+        refined = refine_text_with_paragraphs(
+            "bom dia a todos\n\nbom dia a todos\n\nbom dia a todos",
+            model="llama3.2:latest",
+            chunk_size=4,
+        )
+
+        self.assertEqual(refined, "Bom dia a todos.\n\nBom dia a todos.\n\nBom dia a todos.")
+        self.assertEqual(mock_ollama.chat.call_count, 1)
+
+    @patch("refine.ollama_integration.REVIEW_MIN_WORDS", 0)
+    @patch("refine.ollama_integration.ollama")
+    def test_short_paragraphs_share_one_request(self, mock_ollama):
+        mock_ollama.chat.return_value = iter([
+            {"message": {"content": "Primeiro bloco.\n\n"}},
+            {"message": {"content": "Segundo bloco."}},
+        ])
+
+        refined = refine_text_with_paragraphs(
+            "primeiro bloco.\n\nsegundo bloco.",
+            model="llama3.2:latest",
+        )
+
+        self.assertEqual(refined, "Primeiro bloco.\n\nSegundo bloco.")
+        self.assertEqual(mock_ollama.chat.call_count, 1)
+
+    @patch("refine.ollama_integration.ollama")
+    def test_clean_short_chunks_skip_the_model(self, mock_ollama):
+        mock_ollama.chat.return_value = iter([{"message": {"content": "Segundo bloco, bloco curto."}}])
+
+        refined = refine_text_with_paragraphs(
+            "primeiro bloco curto.\n\nsegundo bloco bloco curto.",
+            model="llama3.2:latest",
+            chunk_size=4,
+        )
+
+        self.assertEqual(mock_ollama.chat.call_count, 1)
+        self.assertEqual(refined, "Primeiro bloco curto.\n\nSegundo bloco, bloco curto.")
+
+    @patch("refine.ollama_integration.REVIEW_MIN_WORDS", 0)
+    @patch("refine.ollama_integration.ollama")
+    def test_paragraph_refinement_rejects_summaries(self, mock_ollama):
+        mock_ollama.chat.side_effect = lambda **kwargs: iter([{"message": {"content": "Resumo."}}])
+
+        refined = refine_text_with_paragraphs(
+            "primeiro bloco de texto.\n\nsegundo bloco de texto.",
+            model="llama3.2:latest",
+            chunk_size=4,
+        )
+
+        self.assertEqual(refined, "Primeiro bloco de texto.\n\nSegundo bloco de texto.")
+
+    @patch("refine.ollama_integration.ollama")
+    def test_smart_chunk_text_requests_structured_output(self, mock_ollama):
+        mock_ollama.chat.return_value = {
+            "message": {"content": '{"paragraphs": ["Primeiro bloco.", " Segundo bloco. "]}'}
+        }
+
+        paragraphs = smart_chunk_text("primeiro bloco segundo bloco", model="llama3.2:latest")
+
+        self.assertEqual(paragraphs, ["Primeiro bloco.", "Segundo bloco."])
+        self.assertIn("paragraphs", mock_ollama.chat.call_args.kwargs["format"]["properties"])
+
+    @patch("refine.ollama_integration.ollama")
+    def test_smart_chunk_text_rejects_off_schema_response(self, mock_ollama):
+        mock_ollama.chat.return_value = {"message": {"content": '{"paragraphs": ["ok", 3]}'}}
+
+        paragraphs = smart_chunk_text("texto original", model="llama3.2:latest")
+
+        self.assertEqual(paragraphs, ["texto original"])
+
+    @patch("refine.ollama_integration.ollama")
+    def test_disk_cache_skips_repeated_llm_calls(self, mock_ollama):
+        mock_ollama.chat.return_value = iter([
+            {"message": {"content": "Texto revisado com pontuação."}}
+        ])
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = {"TXTREFINE_LLM_CACHE": "1", "TXTREFINE_CACHE_DIR": cache_dir}
+            with patch.dict(os.environ, env):
+                first = single_pass_refine("texto revisado com pontuação", model="llama3.2:latest")
+                get_global_cache().clear_cache()
+                second = single_pass_refine("texto revisado com pontuação", model="llama3.2:latest")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_ollama.chat.call_count, 1)
+
+    @patch("refine.ollama_integration.ollama")
+    def test_smart_chunk_text_reuses_cached_segmentation(self, mock_ollama):
+        mock_ollama.chat.return_value = {
+            "message": {"content": '{"paragraphs": ["Primeiro bloco.", "Segundo bloco."]}'}
+        }
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = {"TXTREFINE_LLM_CACHE": "1", "TXTREFINE_CACHE_DIR": cache_dir}
+            with patch.dict(os.environ, env):
+                first = smart_chunk_text("primeiro bloco segundo bloco", model="llama3.2:latest")
+                second = smart_chunk_text("primeiro bloco segundo bloco", model="llama3.2:latest")
+                self.assertEqual(os.listdir(cache_dir), ["llm"])
+                self.assertEqual(len(os.listdir(os.path.join(cache_dir, "llm"))), 1)
+
+        self.assertEqual(first, ["Primeiro bloco.", "Segundo bloco."])
+        self.assertEqual(first, second)
+        self.assertEqual(mock_ollama.chat.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
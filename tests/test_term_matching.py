@@ -1,6 +1,8 @@
 import unittest
+from unittest.mock import patch
 
-from refine.term_matching import find_best_match, normalize_text
+from refine import term_matching
+from refine.term_matching import apply_corrections, find_best_match, normalize_text
 
 
 class TestTermMatching(unittest.TestCase):
@@ -15,10 +17,36 @@ class TestTermMatching(unittest.TestCase):
         result = find_best_match("microsof teams", "platform_terms", cutoff=0.7)
         self.assertEqual(result, "microsoft teams")
 
+    def test_fuzzy_match_same_with_and_without_rapidfuzz(self):
+        terms = ["ollmra", "chagt", "microsof teams", "transcrisao", "whatsap"]
+
+        def lookups():
+            term_matching._closest_match.cache_clear()
+            return [find_best_match(term, "platform_terms") for term in terms]
+
+        self.addCleanup(term_matching._closest_match.cache_clear)
+        with_backend = lookups()
+        with patch.object(term_matching, "fuzz_process", None):
+            without_backend = lookups()
+        self.assertEqual(with_backend, without_backend)
+        self.assertIsNone(with_backend[0])
+
     def test_find_best_match_invalid_category(self):
         result = find_best_match("Microsoft Teams", "unknown")
         self.assertIsNone(result)
 
+    def test_apply_corrections_single_pass(self):
+        result = apply_corrections("Mandei no whats app e no MS TEAMS pelo Olama.")
+        self.assertEqual(result, "Mandei no WhatsApp e no Microsoft Teams pelo Ollama.")
+
+    def test_apply_corrections_leaves_clean_text(self):
+        text = "Nada para corrigir aqui."
+        self.assertIs(apply_corrections(text), text)
+
+    def test_apply_corrections_handles_case_folded_characters(self):
+        self.assertEqual(apply_corrections("olama e whatſ app"), "Ollama e WhatsApp")
+        self.assertEqual(apply_corrections("olama e transcr\u0130sao"), "Ollama e transcrição")
+
 
 if __name__ == "__main__":
     unittest.main()
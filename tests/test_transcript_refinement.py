@@ -14,6 +14,27 @@ class TestTranscriptRefinementSystem(unittest.TestCase):
         self.assertIn("ChatGPT", corrected)
         self.assertGreaterEqual(len(corrections), 2)
 
+    def test_each_phrase_corrected_once(self):
+        raw = "Mandei no whats app e no MS TEAMS."
+        corrected, corrections = self.system.find_and_correct_terms(raw)
+        self.assertEqual(corrected, "Mandei no WhatsApp e no Microsoft Teams.")
+        self.assertEqual(
+            [item.original for item in corrections],
+            ["whats app", "MS TEAMS"],
+        )
+        self.assertEqual(corrections[0].corrected, "WhatsApp")
+
+    def test_corrections_follow_source_casing(self):
+        raw = "OLAMA, Olama e olama"
+        corrected, _ = self.system.find_and_correct_terms(raw)
+        self.assertEqual(corrected, "OLLAMA, Ollama e Ollama.")
+
+    def test_corrections_accept_case_folded_characters(self):
+        corrected, _ = self.system.find_and_correct_terms("olama e whatſ app")
+        self.assertEqual(corrected, "Ollama e WhatsApp.")
+        corrected, _ = self.system.find_and_correct_terms("olama e transcr\u0130sao")
+        self.assertEqual(corrected, "Ollama e transcrição.")
+
     def test_duplicate_phrase_cleanup(self):
         raw = "O plano de ação plano de ação ficou melhor."
         corrected, _ = self.system.find_and_correct_terms(raw)
@@ -24,6 +45,35 @@ class TestTranscriptRefinementSystem(unittest.TestCase):
         corrected, _ = self.system.find_and_correct_terms(raw)
         self.assertEqual(corrected, "Eu acho que a gente pode seguir.")
 
+    def test_repeated_connector_run_collapses_once(self):
+        raw = "Ele falou que que que a a gente pode seguir."
+        corrected, corrections = self.system.find_and_correct_terms(raw)
+        self.assertEqual(corrected, "Ele falou que a gente pode seguir.")
+        self.assertEqual(len(corrections), 2)
+
+    def test_pronoun_stutter_cleanup(self):
+        raw = "Eu eu acho que isso isso resolve com com calma."
+        corrected, _ = self.system.find_and_correct_terms(raw)
+        self.assertEqual(corrected, "Eu acho que isso resolve com calma.")
+
+    def test_repeats_wrapped_onto_next_line_collapse(self):
+        corrected, _ = self.system.find_and_correct_terms("eu acho que\nque a gente vai")
+        self.assertEqual(corrected, "Eu acho que a gente vai.")
+        corrected, _ = self.system.find_and_correct_terms("ele falou de\nde novo")
+        self.assertEqual(corrected, "Ele falou de novo.")
+        corrected, _ = self.system.find_and_correct_terms("o plano de ação\nplano de ação ficou melhor")
+        self.assertEqual(corrected, "O plano de ação ficou melhor.")
+
+    def test_phrase_repeat_across_paragraphs_is_kept(self):
+        raw = "revisamos o plano de ação\n\nplano de ação ficou melhor"
+        corrected, _ = self.system.find_and_correct_terms(raw)
+        self.assertEqual(corrected, "Revisamos o plano de ação.\n\nPlano de ação ficou melhor.")
+
+    def test_connector_repeat_across_paragraphs_is_kept(self):
+        raw = "foi isso que eu disse pra ele\n\nele respondeu que não"
+        corrected, _ = self.system.find_and_correct_terms(raw)
+        self.assertEqual(corrected, "Foi isso que eu disse pra ele.\n\nEle respondeu que não.")
+
     def test_conservative_when_no_change_needed(self):
         raw = "A gravação ficou clara e fácil de revisar."
         corrected, corrections = self.system.find_and_correct_terms(raw)
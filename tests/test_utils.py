@@ -1,13 +1,40 @@
+import io
+import os
+import shutil
+import tempfile
+import threading
 import unittest
+from unittest.mock import patch
 
-from refine.utils import clean_text, remove_noise_markers, remove_timestamps
+from refine.utils import (
+    DiskCache,
+    StreamingTextProcessor,
+    TextProcessingCache,
+    _ensured_dirs,
+    clean_text,
+    list_input_files,
+    list_output_files,
+    read_text_file,
+    remove_noise_markers,
+    remove_timestamps,
+    split_into_chunks,
+    write_text_file,
+)
 
 
 class TestUtils(unittest.TestCase):
+    def setUp(self):
+        # Directories ensured by earlier tests live in deleted temp folders.
+        self.addCleanup(_ensured_dirs.clear)
+
     def test_remove_timestamps(self):
         raw = "00:01 Bom dia\n[01:23] tudo bem\n02:34:56 teste"
         self.assertEqual(remove_timestamps(raw), "Bom dia\ntudo bem\nteste")
 
+    def test_remove_timestamps_keeps_paragraph_breaks(self):
+        raw = "Bom dia\n\n00:05\n[00:06] [00:07] - Tudo bem"
+        self.assertEqual(remove_timestamps(raw), "Bom dia\n\nTudo bem")
+
     def test_remove_noise_markers(self):
         raw = "[Música] Olá (risos) mundo [aplausos]"
         self.assertEqual(remove_noise_markers(raw), "Olá mundo")
@@ -16,10 +43,186 @@ class TestUtils(unittest.TestCase):
         raw = "Olá  ,   mundo !\n\n\nLinha   dois  ."
         self.assertEqual(clean_text(raw), "Olá, mundo!\n\nLinha dois.")
 
+    def test_clean_text_trims_unicode_whitespace_at_edges(self):
+        self.assertEqual(clean_text("\xa0ção\xa0"), "ção")
+        self.assertEqual(clean_text("\x0cb\x85"), "b")
+
     def test_clean_text_preserves_paragraphs(self):
         raw = "Primeiro bloco.\n\nSegundo bloco."
         self.assertEqual(clean_text(raw), "Primeiro bloco.\n\nSegundo bloco.")
 
+    def test_clean_text_joins_hyphenated_line_breaks_only(self):
+        self.assertEqual(clean_text("pala-\n vra"), "palavra")
+        self.assertEqual(clean_text("re-\npre-\nsentação"), "representação")
+        self.assertEqual(clean_text("fim-\n\nNovo bloco"), "fim-\n\nNovo bloco")
+
+    def test_split_into_chunks_packs_paragraphs(self):
+        raw = "um dois.\n\ntres quatro.\n\ncinco seis sete oito nove"
+        self.assertEqual(
+            split_into_chunks(raw, max_words=4),
+            ["um dois.\n\ntres quatro.", "cinco seis sete oito", "nove"],
+        )
+
+    def test_split_into_chunks_rejects_non_positive_limit(self):
+        for max_words in (0, -3):
+            with self.assertRaises(ValueError):
+                split_into_chunks("um dois tres", max_words=max_words)
+
+    def test_write_text_file_creates_directory_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target_dir = os.path.join(tmp, "nested", "output")
+            self.assertTrue(write_text_file(os.path.join(target_dir, "a.txt"), "um"))
+            with patch("refine.utils.os.makedirs") as makedirs:
+                self.assertTrue(write_text_file(os.path.join(target_dir, "b.txt"), "dois"))
+            makedirs.assert_not_called()
+            self.assertEqual(read_text_file(os.path.join(target_dir, "b.txt")), "dois")
+
+    def test_write_text_file_recreates_removed_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target_dir = os.path.join(tmp, "output")
+            self.assertTrue(write_text_file(os.path.join(target_dir, "a.txt"), "um"))
+            shutil.rmtree(target_dir)
+            self.assertTrue(write_text_file(os.path.join(target_dir, "b.txt"), "dois"))
+            self.assertEqual(read_text_file(os.path.join(target_dir, "b.txt")), "dois")
+
+    def test_list_input_files_only_returns_txt_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("a.txt", "b.md"):
+                with open(os.path.join(tmp, name), "w", encoding="utf-8") as handle:
+                    handle.write("x")
+            os.mkdir(os.path.join(tmp, "folder.txt"))
+            self.assertEqual(list_input_files(tmp), ["a.txt"])
+
+    def test_cache_keys_separate_models_and_operations(self):
+        cache = TextProcessingCache(max_size=10)
+        cache.set_llm_response("texto", "modelo-a", "A")
+        cache.set_llm_response("texto", "modelo-b", "B")
+        self.assertEqual(cache.get_llm_response("texto", "modelo-a"), "A")
+        self.assertEqual(cache.get_llm_response("texto", "modelo-b"), "B")
+        self.assertIsNone(cache.get_transcript_corrections("texto"))
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = TextProcessingCache(max_size=2)
+        cache.set_llm_response("a", "m", "A")
+        cache.set_llm_response("b", "m", "B")
+        cache.get_llm_response("a", "m")
+        cache.set_llm_response("c", "m", "C")
+        self.assertEqual(cache.get_llm_response("a", "m"), "A")
+        self.assertIsNone(cache.get_llm_response("b", "m"))
+        self.assertEqual(cache.get_stats()["llm_cache_size"], 2)
+
+    def test_cache_evicts_to_stay_within_byte_budget(self):
+        cache = TextProcessingCache(max_size=10, max_bytes=600)
+        cache.set_llm_response("a" * 300, "m", "A")
+        cache.set_llm_response("b" * 300, "m", "B")
+        self.assertIsNone(cache.get_llm_response("a" * 300, "m"))
+        self.assertEqual(cache.get_llm_response("b" * 300, "m"), "B")
+        self.assertLessEqual(cache.get_stats()["bytes_used"], 600)
+        cache.clear_cache()
+        self.assertEqual(cache.get_stats()["bytes_used"], 0)
+
+    def test_streaming_chunks_end_on_paragraph_breaks(self):
+        processor = StreamingTextProcessor(chunk_size=20)
+        stream = io.StringIO("primeira linha longa\ncontinua\n\nsegundo bloco\n\nfim\n")
+        chunks = list(processor._iter_paragraph_chunks(stream))
+        self.assertEqual(
+            chunks,
+            ["primeira linha longa\ncontinua\n\n", "segundo bloco\n\nfim\n"],
+        )
+
+    def test_streaming_splits_single_line_on_spaces(self):
+        processor = StreamingTextProcessor(chunk_size=100)
+        text = " ".join(["palavra"] * 200)
+        chunks = list(processor._iter_paragraph_chunks(io.StringIO(text)))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 110 for chunk in chunks[:-1]))
+        self.assertEqual("".join(chunks), text)
+        self.assertTrue(all(word == "palavra" for chunk in chunks for word in chunk.split()))
+
+    def test_streaming_reports_input_counts(self):
+        processor = StreamingTextProcessor(chunk_size=50)
+        text = "\n\n".join(["um dois três quatro cinco seis"] * 10)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grande.txt")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+            stats = {}
+            with patch.object(processor, "_process_chunk", side_effect=lambda chunk, model: chunk.strip()):
+                processor.process_large_file(path, file_size=len(text), stats=stats)
+        self.assertEqual(stats["words"], 60)
+        self.assertEqual(stats["characters"], len(text))
+        self.assertEqual(stats["content_characters"], len("".join(text.split())))
+
+    def test_streaming_content_scan_stops_at_limit(self):
+        processor = StreamingTextProcessor(chunk_size=50)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grande.txt")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(" \n" * 200 + "abc\n\n" + "palavra " * 100)
+            self.assertEqual(processor.count_content_characters(path, limit=11), 11)
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(" \n" * 200 + "abc")
+            self.assertEqual(processor.count_content_characters(path, limit=11), 3)
+
+    def test_cache_is_safe_under_concurrent_eviction(self):
+        cache = TextProcessingCache(max_size=4)
+        errors = []
+
+        def worker(offset):
+            try:
+                for index in range(2000):
+                    text = str((index + offset) % 8)
+                    cache.set_llm_response(text, "m", text)
+                    cache.get_llm_response(str(index % 8), "m")
+            except Exception as exc:  # surfaced below; thread errors are otherwise lost
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        stats = cache.get_stats()
+        self.assertLessEqual(stats["llm_cache_size"], 4)
+        self.assertEqual(stats["bytes_used"], sum(cache._entry_sizes.values()))
+
+    def test_list_input_files_returns_empty_for_non_directory(self):
+        with tempfile.NamedTemporaryFile(suffix=".txt") as handle:
+            self.assertEqual(list_input_files(handle.name), [])
+            self.assertEqual(list_output_files(handle.name), [])
+
+    def test_disk_cache_concurrent_writes_to_same_key(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DiskCache("llm", base_dir=tmp)
+            values = [{"worker": index, "text": "x" * 5000} for index in range(8)]
+            threads = [threading.Thread(target=cache.set, args=("chave", value)) for value in values]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertIn(cache.get("chave"), values)
+            self.assertEqual(os.listdir(cache.cache_dir), ["chave.json"])
+
+    def test_cache_byte_budget_evicts_across_both_caches(self):
+        cache = TextProcessingCache(max_size=10, max_bytes=3000)
+        cache.set_transcript_corrections("t" * 1000, "T" * 1000, [])
+        for index in range(5):
+            cache.set_llm_response(f"{index}" * 100, "m", "resposta")
+        stats = cache.get_stats()
+        self.assertEqual(stats["transcript_cache_size"], 0)
+        self.assertEqual(stats["llm_cache_size"], 5)
+        self.assertLessEqual(stats["bytes_used"], 3000)
+
+    def test_cache_byte_budget_keeps_recently_read_entries(self):
+        cache = TextProcessingCache(max_size=10, max_bytes=1000)
+        cache.set_transcript_corrections("t" * 300, "T" * 100, [])
+        cache.set_llm_response("a" * 300, "m", "A")
+        cache.get_transcript_corrections("t" * 300)
+        cache.set_llm_response("b" * 300, "m", "B")
+        self.assertIsNotNone(cache.get_transcript_corrections("t" * 300))
+        self.assertIsNone(cache.get_llm_response("a" * 300, "m"))
+
 
 if __name__ == "__main__":
     unittest.main()